@@ -8,146 +8,148 @@ import os
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient
-from passlib.context import CryptContext
+import bcrypt
 import uuid
 
 # Load environment variables
 load_dotenv()
 
-# MongoDB connection
+# MongoDB connection (unjournaled writes: sample data is cheap to re-seed)
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, w=1, journal=False)
 db = client[os.environ['DB_NAME']]
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing (minimum bcrypt cost: the sample passwords are published below)
+BCRYPT_ROUNDS = 4
+
+def hash_password(password):
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
 
 async def init_sample_data():
     """Initialize the database with sample data"""
     
     print("🚀 Initializing B2B E-commerce Platform with sample data...")
     
+    # Shared timestamp for every seeded document
+    now = datetime.utcnow()
+    
     # Clear existing data
     print("🧹 Clearing existing data...")
-    await db.users.delete_many({})
-    await db.categories.delete_many({})
-    await db.products.delete_many({})
-    await db.rfqs.delete_many({})
-    await db.quotes.delete_many({})
-    await db.orders.delete_many({})
+    await asyncio.gather(*[
+        db[collection].delete_many({})
+        for collection in ("users", "categories", "products", "rfqs", "quotes", "orders")
+    ])
+    
+    # Hash each distinct sample password once
+    hashes = {
+        password: hash_password(password)
+        for password in ("admin123", "supplier123", "buyer123")
+    }
     
     # Create admin user
-    admin_id = str(uuid.uuid4())
+    admin_id = uuid.uuid4().hex
     admin_user = {
         "id": admin_id,
         "email": "admin@b2bcommerce.com",
-        "hashed_password": pwd_context.hash("admin123"),
+        "hashed_password": hashes["admin123"],
         "company_name": "B2B Commerce Admin",
         "contact_person": "Admin User",
         "phone": "+1-555-0001",
         "role": "admin",
         "is_active": True,
-        "created_at": datetime.utcnow()
+        "created_at": now
     }
-    await db.users.insert_one(admin_user)
-    print("👤 Created admin user: admin@b2bcommerce.com / admin123")
     
     # Create supplier users
-    supplier1_id = str(uuid.uuid4())
+    supplier1_id = uuid.uuid4().hex
     supplier1 = {
         "id": supplier1_id,
         "email": "supplier@chemcorp.com",
-        "hashed_password": pwd_context.hash("supplier123"),
+        "hashed_password": hashes["supplier123"],
         "company_name": "ChemCorp Industries",
         "contact_person": "John Smith",
         "phone": "+1-555-0002",
         "role": "supplier",
         "is_active": True,
-        "created_at": datetime.utcnow()
+        "created_at": now
     }
-    await db.users.insert_one(supplier1)
     
-    supplier2_id = str(uuid.uuid4())
+    supplier2_id = uuid.uuid4().hex
     supplier2 = {
         "id": supplier2_id,
         "email": "supplier@hardwareplus.com",
-        "hashed_password": pwd_context.hash("supplier123"),
+        "hashed_password": hashes["supplier123"],
         "company_name": "Hardware Plus Ltd",
         "contact_person": "Sarah Johnson",
         "phone": "+1-555-0003",
         "role": "supplier",
         "is_active": True,
-        "created_at": datetime.utcnow()
+        "created_at": now
     }
-    await db.users.insert_one(supplier2)
-    print("🏭 Created supplier users: supplier@chemcorp.com / supplier123 and supplier@hardwareplus.com / supplier123")
     
     # Create buyer users
-    buyer1_id = str(uuid.uuid4())
+    buyer1_id = uuid.uuid4().hex
     buyer1 = {
         "id": buyer1_id,
         "email": "buyer@manufacturing.com",
-        "hashed_password": pwd_context.hash("buyer123"),
+        "hashed_password": hashes["buyer123"],
         "company_name": "ABC Manufacturing",
         "contact_person": "Mike Davis",
         "phone": "+1-555-0004",
         "role": "buyer",
         "is_active": True,
-        "created_at": datetime.utcnow()
+        "created_at": now
     }
-    await db.users.insert_one(buyer1)
     
-    buyer2_id = str(uuid.uuid4())
+    buyer2_id = uuid.uuid4().hex
     buyer2 = {
         "id": buyer2_id,
         "email": "buyer@construction.com",
-        "hashed_password": pwd_context.hash("buyer123"),
+        "hashed_password": hashes["buyer123"],
         "company_name": "XYZ Construction",
         "contact_person": "Lisa Brown",
         "phone": "+1-555-0005",
         "role": "buyer",
         "is_active": True,
-        "created_at": datetime.utcnow()
+        "created_at": now
     }
-    await db.users.insert_one(buyer2)
-    print("🏢 Created buyer users: buyer@manufacturing.com / buyer123 and buyer@construction.com / buyer123")
+    
+    users = [admin_user, supplier1, supplier2, buyer1, buyer2]
     
     # Create categories
-    chemical_cat_id = str(uuid.uuid4())
+    chemical_cat_id = uuid.uuid4().hex
     chemical_category = {
         "id": chemical_cat_id,
         "name": "Chemicals",
         "description": "Industrial and laboratory chemicals",
         "parent_id": None,
-        "created_at": datetime.utcnow()
+        "created_at": now
     }
-    await db.categories.insert_one(chemical_category)
     
-    hardware_cat_id = str(uuid.uuid4())
+    hardware_cat_id = uuid.uuid4().hex
     hardware_category = {
         "id": hardware_cat_id,
         "name": "Hardware & Tools",
         "description": "Industrial hardware and tools",
         "parent_id": None,
-        "created_at": datetime.utcnow()
+        "created_at": now
     }
-    await db.categories.insert_one(hardware_category)
     
-    safety_cat_id = str(uuid.uuid4())
+    safety_cat_id = uuid.uuid4().hex
     safety_category = {
         "id": safety_cat_id,
         "name": "Safety Equipment",
         "description": "Personal protective equipment and safety gear",
         "parent_id": None,
-        "created_at": datetime.utcnow()
+        "created_at": now
     }
-    await db.categories.insert_one(safety_category)
-    print("📂 Created product categories")
+    
+    categories = [chemical_category, hardware_category, safety_category]
     
     # Create products
     products = [
         {
-            "id": str(uuid.uuid4()),
+            "id": uuid.uuid4().hex,
             "name": "Industrial Grade Sulfuric Acid",
             "description": "High purity sulfuric acid (H2SO4) 98% concentration for industrial applications",
             "category_id": chemical_cat_id,
@@ -164,10 +166,10 @@ async def init_sample_data():
             },
             "images": [],
             "is_active": True,
-            "created_at": datetime.utcnow()
+            "created_at": now
         },
         {
-            "id": str(uuid.uuid4()),
+            "id": uuid.uuid4().hex,
             "name": "Sodium Hydroxide (Caustic Soda)",
             "description": "Food grade sodium hydroxide pellets for industrial cleaning and processing",
             "category_id": chemical_cat_id,
@@ -184,10 +186,10 @@ async def init_sample_data():
             },
             "images": [],
             "is_active": True,
-            "created_at": datetime.utcnow()
+            "created_at": now
         },
         {
-            "id": str(uuid.uuid4()),
+            "id": uuid.uuid4().hex,
             "name": "Industrial Ball Bearings Set",
             "description": "Precision steel ball bearings for heavy machinery applications",
             "category_id": hardware_cat_id,
@@ -204,10 +206,10 @@ async def init_sample_data():
             },
             "images": [],
             "is_active": True,
-            "created_at": datetime.utcnow()
+            "created_at": now
         },
         {
-            "id": str(uuid.uuid4()),
+            "id": uuid.uuid4().hex,
             "name": "Heavy Duty Safety Helmets",
             "description": "ANSI/OSHA compliant hard hats for construction and industrial use",
             "category_id": safety_cat_id,
@@ -224,10 +226,10 @@ async def init_sample_data():
             },
             "images": [],
             "is_active": True,
-            "created_at": datetime.utcnow()
+            "created_at": now
         },
         {
-            "id": str(uuid.uuid4()),
+            "id": uuid.uuid4().hex,
             "name": "Precision Cutting Tools",
             "description": "Carbide-tipped cutting tools for machining operations",
             "category_id": hardware_cat_id,
@@ -244,16 +246,12 @@ async def init_sample_data():
             },
             "images": [],
             "is_active": True,
-            "created_at": datetime.utcnow()
+            "created_at": now
         }
     ]
     
-    for product in products:
-        await db.products.insert_one(product)
-    print("📦 Created 5 sample products")
-    
     # Create sample RFQs
-    rfq1_id = str(uuid.uuid4())
+    rfq1_id = uuid.uuid4().hex
     rfq1 = {
         "id": rfq1_id,
         "buyer_id": buyer1_id,
@@ -261,12 +259,11 @@ async def init_sample_data():
         "quantity": 100,
         "message": "Need bulk quantity for manufacturing process. Looking for competitive pricing.",
         "status": "open",
-        "created_at": datetime.utcnow(),
-        "expires_at": datetime.utcnow() + timedelta(days=7)
+        "created_at": now,
+        "expires_at": now + timedelta(days=7)
     }
-    await db.rfqs.insert_one(rfq1)
     
-    rfq2_id = str(uuid.uuid4())
+    rfq2_id = uuid.uuid4().hex
     rfq2 = {
         "id": rfq2_id,
         "buyer_id": buyer2_id,
@@ -274,10 +271,24 @@ async def init_sample_data():
         "quantity": 500,
         "message": "Urgent requirement for construction project. Need ANSI compliant helmets.",
         "status": "open",
-        "created_at": datetime.utcnow(),
-        "expires_at": datetime.utcnow() + timedelta(days=5)
+        "created_at": now,
+        "expires_at": now + timedelta(days=5)
     }
-    await db.rfqs.insert_one(rfq2)
+    
+    rfqs = [rfq1, rfq2]
+    
+    # Insert every collection concurrently
+    await asyncio.gather(
+        db.users.insert_many(users, ordered=False),
+        db.categories.insert_many(categories, ordered=False),
+        db.products.insert_many(products, ordered=False),
+        db.rfqs.insert_many(rfqs, ordered=False)
+    )
+    print("👤 Created admin user: admin@b2bcommerce.com / admin123")
+    print("🏭 Created supplier users: supplier@chemcorp.com / supplier123 and supplier@hardwareplus.com / supplier123")
+    print("🏢 Created buyer users: buyer@manufacturing.com / buyer123 and buyer@construction.com / buyer123")
+    print("📂 Created product categories")
+    print("📦 Created 5 sample products")
     print("📋 Created 2 sample RFQs")
     
     print("✅ Sample data initialization completed!")
@@ -1,9 +1,14 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import DuplicateKeyError
 import os
+import time
+import asyncio
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
@@ -11,8 +16,10 @@ from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timedelta
 import jwt
-from passlib.context import CryptContext
+import bcrypt
+from cachetools import TTLCache
 import json
+import orjson
 from enum import Enum
 
 ROOT_DIR = Path(__file__).parent
@@ -20,22 +27,46 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=50,
+    minPoolSize=10,
+    maxIdleTimeMS=300000,
+    waitQueueTimeoutMS=5000,
+    retryWrites=True
+)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 # Security setup
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_ROUNDS = 12
+# bcrypt only uses the first 72 bytes of a password; passlib truncated silently
+BCRYPT_MAX_PASSWORD_BYTES = 72
 security = HTTPBearer()
 SECRET_KEY = "b2b_ecommerce_secret_key_change_in_production"
 ALGORITHM = "HS256"
+# Tokens carry no audience or issuer, so those claim checks are skipped on decode
+JWT_DECODE_OPTIONS = {"verify_aud": False, "verify_iss": False}
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Maximum number of read-only calls accepted by /batch
+MAX_BATCH_CALLS = 20
+
+# List endpoints return at most this many documents, read from Mongo in batches
+MAX_LIST_RESULTS = 1000
+CURSOR_BATCH_SIZE = 200
+
+# Authenticated users by bearer token, so repeat requests skip the JWT decode and user lookup
+user_cache = TTLCache(maxsize=10000, ttl=60)
+
+def new_id() -> str:
+    return uuid.uuid4().hex
+
 # Enums
 class UserRole(str, Enum):
     ADMIN = "admin"
@@ -56,7 +87,7 @@ class RFQStatus(str, Enum):
 
 # Models
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     email: EmailStr
     company_name: str
     contact_person: str
@@ -83,7 +114,7 @@ class Token(BaseModel):
     user: User
 
 class Category(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     name: str
     description: str = ""
     parent_id: Optional[str] = None
@@ -95,7 +126,7 @@ class CategoryCreate(BaseModel):
     parent_id: Optional[str] = None
 
 class Product(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     name: str
     description: str
     category_id: str
@@ -118,7 +149,7 @@ class ProductCreate(BaseModel):
     specifications: Dict[str, Any] = {}
 
 class RFQ(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     buyer_id: str
     product_id: str
     quantity: int
@@ -134,7 +165,7 @@ class RFQCreate(BaseModel):
     expires_in_days: int = 7
 
 class Quote(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     rfq_id: str
     supplier_id: str
     price_per_unit: float
@@ -150,7 +181,7 @@ class QuoteCreate(BaseModel):
     message: str = ""
 
 class Order(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     buyer_id: str
     supplier_id: str
     product_id: str
@@ -165,12 +196,24 @@ class OrderCreate(BaseModel):
     quote_id: str
     shipping_address: str
 
+class BatchCall(BaseModel):
+    method: str = "GET"
+    path: str
+    auth: Optional[str] = None
+
 # Utility functions
+def bcrypt_secret(password: str) -> bytes:
+    return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(bcrypt_secret(plain_password), hashed_password.encode("utf-8"))
+    except ValueError:
+        # Missing or malformed stored hash
+        return False
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(bcrypt_secret(password), bcrypt.gensalt(BCRYPT_ROUNDS)).decode("utf-8")
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -183,19 +226,60 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    token = credentials.credentials
+    cached = user_cache.get(token)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at > time.time():
+            return user
+        user_cache.pop(token, None)
+    
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-    except:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options=JWT_DECODE_OPTIONS)
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+    email: str = payload.get("sub")
+    if email is None:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
     
-    user = await db.users.find_one({"email": email})
-    if user is None:
+    user_doc = await db.users.find_one({"email": email})
+    if user_doc is None:
         raise HTTPException(status_code=401, detail="User not found")
-    return User(**user)
+    user = User(**user_doc)
+    user_cache[token] = (user, payload.get("exp", 0))
+    return user
+
+def supplier_open_rfqs_pipeline(supplier_id: str) -> List[Dict[str, Any]]:
+    """Aggregation stages matching open RFQs whose product belongs to the supplier"""
+    return [
+        {"$match": {"status": "open"}},
+        {"$lookup": {
+            "from": "products",
+            "let": {"product_id": "$product_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$id", "$$product_id"]}}},
+                {"$project": {"_id": 0, "supplier_id": 1}}
+            ],
+            "as": "product"
+        }},
+        {"$match": {"product.supplier_id": supplier_id}}
+    ]
+
+async def encode_documents(first_doc, cursor):
+    """Encode cursor documents into a JSON array as each batch arrives"""
+    yield b"[" + orjson.dumps(first_doc)
+    async for doc in cursor:
+        yield b"," + orjson.dumps(doc)
+    yield b"]"
+
+async def stream_documents(cursor) -> Response:
+    # Fetch the first batch before the 200 status is sent, so query errors still fail the request
+    cursor = cursor.batch_size(CURSOR_BATCH_SIZE)
+    try:
+        first_doc = await cursor.next()
+    except StopAsyncIteration:
+        return Response(content=b"[]", media_type="application/json")
+    return StreamingResponse(encode_documents(first_doc, cursor), media_type="application/json")
 
 def require_role(required_role: UserRole):
     def role_checker(current_user: User = Depends(get_current_user)):
@@ -207,28 +291,33 @@ def require_role(required_role: UserRole):
 # Authentication endpoints
 @api_router.post("/register", response_model=User)
 async def register(user_data: UserCreate):
-    # Check if user exists
-    existing_user = await db.users.find_one({"email": user_data.email})
-    if existing_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    
     # Hash password and create user
-    hashed_password = get_password_hash(user_data.password)
-    user_dict = user_data.dict()
-    del user_dict['password']
-    user = User(**user_dict)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     
     # Store user with hashed password
-    user_doc = user.dict()
-    user_doc['hashed_password'] = hashed_password
-    await db.users.insert_one(user_doc)
+    user_doc = {
+        "id": new_id(),
+        "email": user_data.email,
+        "company_name": user_data.company_name,
+        "contact_person": user_data.contact_person,
+        "phone": user_data.phone,
+        "role": user_data.role,
+        "is_active": True,
+        "created_at": datetime.utcnow(),
+        "hashed_password": hashed_password
+    }
+    try:
+        await db.users.insert_one(user_doc)
+    except DuplicateKeyError:
+        # The unique index on email rejects existing users
+        raise HTTPException(status_code=400, detail="Email already registered")
     
-    return user
+    return User.construct(**user_doc)
 
 @api_router.post("/login", response_model=Token)
 async def login(login_data: UserLogin):
     user_doc = await db.users.find_one({"email": login_data.email})
-    if not user_doc or not verify_password(login_data.password, user_doc.get('hashed_password', '')):
+    if not user_doc or not await asyncio.to_thread(verify_password, login_data.password, user_doc.get('hashed_password', '')):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     user = User(**user_doc)
@@ -251,17 +340,21 @@ async def create_category(category_data: CategoryCreate, current_user: User = De
 
 @api_router.get("/categories", response_model=List[Category])
 async def get_categories():
-    categories = await db.categories.find().to_list(1000)
-    return [Category(**cat) for cat in categories]
+    return await stream_documents(db.categories.find({}, {"_id": 0}).limit(MAX_LIST_RESULTS))
 
 # Product endpoints
 @api_router.post("/products", response_model=Product)
 async def create_product(product_data: ProductCreate, current_user: User = Depends(require_role(UserRole.SUPPLIER))):
-    product_dict = product_data.dict()
-    product_dict['supplier_id'] = current_user.id
-    product = Product(**product_dict)
-    await db.products.insert_one(product.dict())
-    return product
+    product_doc = {
+        "id": new_id(),
+        **product_data.dict(),
+        "supplier_id": current_user.id,
+        "images": [],
+        "is_active": True,
+        "created_at": datetime.utcnow()
+    }
+    await db.products.insert_one(product_doc)
+    return Product.construct(**product_doc)
 
 @api_router.get("/products", response_model=List[Product])
 async def get_products(category_id: Optional[str] = None, supplier_id: Optional[str] = None):
@@ -271,8 +364,8 @@ async def get_products(category_id: Optional[str] = None, supplier_id: Optional[
     if supplier_id:
         filter_dict["supplier_id"] = supplier_id
     
-    products = await db.products.find(filter_dict).to_list(1000)
-    return [Product(**prod) for prod in products]
+    # Documents come from our own writes, so skip response_model validation
+    return await stream_documents(db.products.find(filter_dict, {"_id": 0}).limit(MAX_LIST_RESULTS))
 
 @api_router.get("/products/{product_id}", response_model=Product)
 async def get_product(product_id: str):
@@ -283,8 +376,7 @@ async def get_product(product_id: str):
 
 @api_router.get("/my-products", response_model=List[Product])
 async def get_my_products(current_user: User = Depends(require_role(UserRole.SUPPLIER))):
-    products = await db.products.find({"supplier_id": current_user.id}).to_list(1000)
-    return [Product(**prod) for prod in products]
+    return await stream_documents(db.products.find({"supplier_id": current_user.id}, {"_id": 0}).limit(MAX_LIST_RESULTS))
 
 # RFQ endpoints
 @api_router.post("/rfqs", response_model=RFQ)
@@ -294,55 +386,81 @@ async def create_rfq(rfq_data: RFQCreate, current_user: User = Depends(require_r
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    rfq_dict = rfq_data.dict()
-    rfq_dict['buyer_id'] = current_user.id
-    rfq_dict['expires_at'] = datetime.utcnow() + timedelta(days=rfq_data.expires_in_days)
-    del rfq_dict['expires_in_days']
-    
-    rfq = RFQ(**rfq_dict)
-    await db.rfqs.insert_one(rfq.dict())
-    return rfq
+    now = datetime.utcnow()
+    rfq_doc = {
+        "id": new_id(),
+        "buyer_id": current_user.id,
+        "product_id": rfq_data.product_id,
+        "quantity": rfq_data.quantity,
+        "message": rfq_data.message,
+        "status": RFQStatus.OPEN,
+        "created_at": now,
+        "expires_at": now + timedelta(days=rfq_data.expires_in_days)
+    }
+    await db.rfqs.insert_one(rfq_doc)
+    return RFQ.construct(**rfq_doc)
 
 @api_router.get("/rfqs", response_model=List[RFQ])
 async def get_rfqs(current_user: User = Depends(get_current_user)):
     if current_user.role == UserRole.BUYER:
-        rfqs = await db.rfqs.find({"buyer_id": current_user.id}).to_list(1000)
+        rfqs = db.rfqs.find({"buyer_id": current_user.id}, {"_id": 0}).limit(MAX_LIST_RESULTS)
     elif current_user.role == UserRole.SUPPLIER:
-        # Get RFQs for supplier's products
-        supplier_products = await db.products.find({"supplier_id": current_user.id}).to_list(1000)
-        product_ids = [prod["id"] for prod in supplier_products]
-        rfqs = await db.rfqs.find({"product_id": {"$in": product_ids}, "status": "open"}).to_list(1000)
+        # Get open RFQs for supplier's products
+        pipeline = supplier_open_rfqs_pipeline(current_user.id) + [
+            {"$project": {"_id": 0, "product": 0}},
+            {"$limit": MAX_LIST_RESULTS}
+        ]
+        rfqs = db.rfqs.aggregate(pipeline)
     else:  # Admin
-        rfqs = await db.rfqs.find().to_list(1000)
+        rfqs = db.rfqs.find({}, {"_id": 0}).limit(MAX_LIST_RESULTS)
     
-    return [RFQ(**rfq) for rfq in rfqs]
+    return await stream_documents(rfqs)
 
 # Quote endpoints
 @api_router.post("/quotes", response_model=Quote)
 async def create_quote(quote_data: QuoteCreate, current_user: User = Depends(require_role(UserRole.SUPPLIER))):
+    # Fetch the RFQ together with its product if it belongs to this supplier
+    rfqs = await db.rfqs.aggregate([
+        {"$match": {"id": quote_data.rfq_id}},
+        {"$limit": 1},
+        {"$lookup": {
+            "from": "products",
+            "let": {"product_id": "$product_id"},
+            "pipeline": [
+                {"$match": {
+                    "$expr": {"$eq": ["$id", "$$product_id"]},
+                    "supplier_id": current_user.id
+                }},
+                {"$project": {"_id": 0, "id": 1}}
+            ],
+            "as": "product"
+        }}
+    ]).to_list(1)
+    
     # Check if RFQ exists and is open
-    rfq = await db.rfqs.find_one({"id": quote_data.rfq_id})
-    if not rfq:
+    if not rfqs:
         raise HTTPException(status_code=404, detail="RFQ not found")
+    rfq = rfqs[0]
     if rfq["status"] != "open":
         raise HTTPException(status_code=400, detail="RFQ is not open for quotes")
     
     # Check if product belongs to this supplier
-    product = await db.products.find_one({"id": rfq["product_id"], "supplier_id": current_user.id})
-    if not product:
+    if not rfq["product"]:
         raise HTTPException(status_code=403, detail="Product does not belong to you")
     
-    quote_dict = quote_data.dict()
-    quote_dict['supplier_id'] = current_user.id
-    quote_dict['total_price'] = quote_data.price_per_unit * rfq["quantity"]
-    
-    quote = Quote(**quote_dict)
-    await db.quotes.insert_one(quote.dict())
+    quote_doc = {
+        "id": new_id(),
+        **quote_data.dict(),
+        "supplier_id": current_user.id,
+        "total_price": quote_data.price_per_unit * rfq["quantity"],
+        "created_at": datetime.utcnow()
+    }
     
-    # Update RFQ status to quoted
+    # Store the quote, then mark the RFQ as quoted only once the quote exists
+    await db.quotes.insert_one(quote_doc)
     await db.rfqs.update_one({"id": quote_data.rfq_id}, {"$set": {"status": "quoted"}})
     
-    return quote
+    return Quote.construct(**quote_doc)
 
 @api_router.get("/quotes/{rfq_id}", response_model=List[Quote])
 async def get_quotes_for_rfq(rfq_id: str, current_user: User = Depends(get_current_user)):
@@ -354,8 +472,7 @@ async def get_quotes_for_rfq(rfq_id: str, current_user: User = Depends(get_curre
     if current_user.role == UserRole.BUYER and rfq["buyer_id"] != current_user.id:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    quotes = await db.quotes.find({"rfq_id": rfq_id}).to_list(1000)
-    return [Quote(**quote) for quote in quotes]
+    return await stream_documents(db.quotes.find({"rfq_id": rfq_id}, {"_id": 0}).limit(MAX_LIST_RESULTS))
 
 # Order endpoints
 @api_router.post("/orders", response_model=Order)
@@ -390,22 +507,24 @@ async def create_order(order_data: OrderCreate, current_user: User = Depends(req
 @api_router.get("/orders", response_model=List[Order])
 async def get_orders(current_user: User = Depends(get_current_user)):
     if current_user.role == UserRole.BUYER:
-        orders = await db.orders.find({"buyer_id": current_user.id}).to_list(1000)
+        orders = db.orders.find({"buyer_id": current_user.id}, {"_id": 0})
     elif current_user.role == UserRole.SUPPLIER:
-        orders = await db.orders.find({"supplier_id": current_user.id}).to_list(1000)
+        orders = db.orders.find({"supplier_id": current_user.id}, {"_id": 0})
     else:  # Admin
-        orders = await db.orders.find().to_list(1000)
+        orders = db.orders.find({}, {"_id": 0})
     
-    return [Order(**order) for order in orders]
+    return await stream_documents(orders.limit(MAX_LIST_RESULTS))
 
 # Dashboard stats endpoints
 @api_router.get("/dashboard/stats")
 async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
     if current_user.role == UserRole.ADMIN:
-        total_users = await db.users.count_documents({})
-        total_products = await db.products.count_documents({})
-        total_orders = await db.orders.count_documents({})
-        total_rfqs = await db.rfqs.count_documents({})
+        total_users, total_products, total_orders, total_rfqs = await asyncio.gather(
+            db.users.estimated_document_count(),
+            db.products.estimated_document_count(),
+            db.orders.estimated_document_count(),
+            db.rfqs.estimated_document_count()
+        )
         
         return {
             "total_users": total_users,
@@ -414,12 +533,13 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
             "total_rfqs": total_rfqs
         }
     elif current_user.role == UserRole.SUPPLIER:
-        my_products = await db.products.count_documents({"supplier_id": current_user.id})
-        my_orders = await db.orders.count_documents({"supplier_id": current_user.id})
-        pending_rfqs = await db.rfqs.count_documents({
-            "product_id": {"$in": [p["id"] for p in await db.products.find({"supplier_id": current_user.id}).to_list(1000)]},
-            "status": "open"
-        })
+        pipeline = supplier_open_rfqs_pipeline(current_user.id) + [{"$count": "count"}]
+        my_products, my_orders, pending = await asyncio.gather(
+            db.products.count_documents({"supplier_id": current_user.id}),
+            db.orders.count_documents({"supplier_id": current_user.id}),
+            db.rfqs.aggregate(pipeline).to_list(1)
+        )
+        pending_rfqs = pending[0]["count"] if pending else 0
         
         return {
             "my_products": my_products,
@@ -427,8 +547,10 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
             "pending_rfqs": pending_rfqs
         }
     else:  # Buyer
-        my_rfqs = await db.rfqs.count_documents({"buyer_id": current_user.id})
-        my_orders = await db.orders.count_documents({"buyer_id": current_user.id})
+        my_rfqs, my_orders = await asyncio.gather(
+            db.rfqs.count_documents({"buyer_id": current_user.id}),
+            db.orders.count_documents({"buyer_id": current_user.id})
+        )
         
         return {
             "my_rfqs": my_rfqs,
@@ -440,6 +562,73 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow()}
 
+# Batch endpoint
+async def dispatch_batch_call(call: BatchCall) -> Dict[str, Any]:
+    """Run one API GET in-process and capture its status and JSON body"""
+    path, _, query = call.path.partition("?")
+    path = api_router.prefix + path
+    headers = [(b"accept", b"application/json")]
+    if call.auth:
+        headers.append((b"authorization", f"Bearer {call.auth}".encode("utf-8")))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "query_string": query.encode("utf-8"),
+        "root_path": "",
+        "headers": headers,
+        "client": None,
+        "server": None
+    }
+    
+    request_sent = False
+    finished = asyncio.Event()
+    
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Streaming responses wait for a disconnect until they finish
+        await finished.wait()
+        return {"type": "http.disconnect"}
+    
+    result = {"status": 500}
+    chunks = []
+    
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+    
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        logger.exception("Batched call to %s failed", call.path)
+    finally:
+        finished.set()
+    
+    body = b"".join(chunks)
+    try:
+        result["body"] = orjson.loads(body) if body else None
+    except orjson.JSONDecodeError:
+        result["body"] = body.decode("utf-8", "replace")
+    return result
+
+@api_router.post("/batch")
+async def batch(calls: List[BatchCall]):
+    if len(calls) > MAX_BATCH_CALLS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_CALLS} calls can be batched")
+    if any(call.method.upper() != "GET" or not call.path.startswith("/") for call in calls):
+        raise HTTPException(status_code=400, detail="Only GET calls to API paths can be batched")
+    
+    return await asyncio.gather(*[dispatch_batch_call(call) for call in calls])
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -451,6 +640,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -458,6 +649,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def warm_up_db_client():
+    # Open the connection pool before the first request arrives
+    await db.command("ping")
+
+@app.on_event("startup")
+async def ensure_indexes():
+    await asyncio.gather(
+        db.users.create_index("email", unique=True),
+        db.users.create_index("id", unique=True),
+        db.categories.create_index("id", unique=True),
+        db.products.create_index("id", unique=True),
+        db.products.create_index([("is_active", 1), ("category_id", 1)]),
+        db.products.create_index("supplier_id"),
+        db.rfqs.create_index("id", unique=True),
+        db.rfqs.create_index("buyer_id"),
+        db.rfqs.create_index([("product_id", 1), ("status", 1)]),
+        db.quotes.create_index("id", unique=True),
+        db.quotes.create_index("rfq_id"),
+        db.orders.create_index("buyer_id"),
+        db.orders.create_index("supplier_id"),
+    )
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
\ No newline at end of file
@@ -5,75 +5,248 @@ Tests all major endpoints and workflows
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 import json
-from datetime import datetime
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import time
 
 class B2BAPITester:
+    # Suites are skipped unless every suite they depend on passed
+    SUITE_DEPENDENCIES = {
+        "User Info": ["Authentication"],
+        "RFQs": ["Authentication", "Products"],
+        "Quotes": ["RFQs"],
+        "Orders": ["Quotes"],
+        "Dashboard Stats": ["Authentication"],
+        "Role-Based Access": ["Authentication", "Categories", "Products"]
+    }
+
     def __init__(self, base_url="https://9901ed96-b7f9-4ceb-87d9-be26f4ca4748.preview.emergentagent.com"):
         self.base_url = base_url
         self.api_url = f"{base_url}/api"
         self.tokens = {}
+        # Request headers per logged-in role, built once at login
+        self.role_headers = {}
         self.users = {}
         self.test_data = {}
         self.tests_run = 0
         self.tests_passed = 0
+        self._counter_lock = threading.Lock()
+
+        # One pooled session per thread so keep-alive connections are reused
+        # without sharing a session between concurrent requests
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        # Suites get their own pool so their API calls never wait behind them
+        self.suite_executor = ThreadPoolExecutor(max_workers=3)
+        self._batch_supported = True
+
+        # Log timestamp, reformatted at most once per second
+        self._ts_last = 0
+        self._ts_str = ''
+        # Log lines are buffered and written out once per suite
+        self._logbuf = []
+
+    @property
+    def session(self):
+        """requests.Session for the calling thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'Content-Type': 'application/json',
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive'
+            })
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self):
+        """Release worker threads and pooled connections"""
+        self.flush_log()
+        self.suite_executor.shutdown()
+        self.executor.shutdown()
+        for session in self._sessions:
+            session.close()
 
     def log(self, message, level="INFO"):
         """Log test messages"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
+        now = int(time.time())
+        if now != self._ts_last:
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+            self._ts_last = now
+        self._logbuf.append(f"[{self._ts_str}] {level}: {message}\n")
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, token=None, description=""):
-        """Run a single API test"""
-        url = f"{self.api_url}{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        if token:
-            headers['Authorization'] = f'Bearer {token}'
+    def flush_log(self):
+        """Write buffered log lines to stdout"""
+        sys.stdout.write(''.join(self._logbuf))
+        self._logbuf.clear()
+        sys.stdout.flush()
 
-        self.tests_run += 1
+    def _prepare(self, name, endpoint, role, description):
+        """Count and announce a test, returning its URL and request headers"""
+        with self._counter_lock:
+            self.tests_run += 1
         self.log(f"🔍 Testing {name}...")
         if description:
-            self.log(f"   Description: {description}")
-        
-        try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers, timeout=10)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=10)
-
-            success = response.status_code == expected_status
-            if success:
+            self.log(f"   Description ({name}): {description}")
+        return self.api_url + endpoint, self.role_headers[role] if role else None
+
+    def _record_status(self, name, status_code, expected_status):
+        """Count and log whether a test got its expected status
+
+        Every line names the test, since concurrent tests interleave in the log.
+        """
+        if status_code == expected_status:
+            with self._counter_lock:
                 self.tests_passed += 1
-                self.log(f"✅ PASSED - Status: {response.status_code}")
+            self.log(f"✅ PASSED - {name} - Status: {status_code}")
+            return True
+        self.log(f"❌ FAILED - {name} - Expected {expected_status}, got {status_code}")
+        return False
+
+    def _finalize(self, name, response, expected_status):
+        """Check a test response's status and decode its JSON body"""
+        if self._record_status(name, response.status_code, expected_status):
+            if not response.content:
+                return True, {}
+            try:
+                return True, orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # Non-UTF-8 bodies: let requests detect the encoding
                 try:
-                    response_data = response.json()
-                    return True, response_data
-                except:
+                    return True, response.json()
+                except ValueError:
                     return True, {}
-            else:
-                self.log(f"❌ FAILED - Expected {expected_status}, got {response.status_code}")
-                try:
-                    error_data = response.json()
-                    self.log(f"   Error: {error_data}")
-                except:
-                    self.log(f"   Response: {response.text}")
-                return False, {}
+        else:
+            try:
+                error_data = response.json()
+                self.log(f"   Error ({name}): {error_data}")
+            except ValueError:
+                self.log(f"   Response ({name}): {response.text}")
+            return False, {}
 
+    def run_test(self, name, method, endpoint, expected_status, data=None, role=None, description=""):
+        """Run a single API test, authenticated as role when given"""
+        url, headers = self._prepare(name, endpoint, role, description)
+        try:
+            response = self.session.request(method, url, json=data, headers=headers, timeout=10)
         except Exception as e:
-            self.log(f"❌ FAILED - Exception: {str(e)}")
+            self.log(f"❌ FAILED - {name} - Exception: {str(e)}")
             return False, {}
+        return self._finalize(name, response, expected_status)
+
+    def run_get(self, name, endpoint, expected_status, role=None, description=""):
+        """Run a GET API test"""
+        url, headers = self._prepare(name, endpoint, role, description)
+        try:
+            response = self.session.get(url, headers=headers, timeout=10)
+        except Exception as e:
+            self.log(f"❌ FAILED - {name} - Exception: {str(e)}")
+            return False, {}
+        return self._finalize(name, response, expected_status)
+
+    def run_post(self, name, endpoint, expected_status, data=None, role=None, description=""):
+        """Run a POST API test with a JSON body"""
+        url, headers = self._prepare(name, endpoint, role, description)
+        try:
+            response = self.session.post(url, json=data, headers=headers, timeout=10)
+        except Exception as e:
+            self.log(f"❌ FAILED - {name} - Exception: {str(e)}")
+            return False, {}
+        return self._finalize(name, response, expected_status)
+
+    def run_parallel(self, calls):
+        """Run independent API tests concurrently, returning results in call order"""
+        futures = [self.executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+    def run_batch(self, calls):
+        """Run GET tests through one /batch request, falling back to parallel calls.
+
+        Each call is a dict with name, endpoint, role and description; results
+        are (success, data) pairs in call order, expecting status 200.
+        """
+        if not calls:
+            return []
+        
+        if self._batch_supported:
+            try:
+                response = self.session.post(
+                    self.api_url + "/batch",
+                    json=[{"method": "GET", "path": call['endpoint'], "auth": self.tokens[call['role']]} for call in calls],
+                    timeout=10
+                )
+            except requests.RequestException as e:
+                self.log(f"⚠️  /batch request failed, falling back to individual calls: {str(e)}")
+                response = None
+            if response is not None:
+                if response.status_code == 200:
+                    try:
+                        results = orjson.loads(response.content)
+                    except orjson.JSONDecodeError:
+                        results = None
+                    # One result per call, or none are trusted: unmatched checks would never be counted
+                    if isinstance(results, list) and len(results) == len(calls):
+                        return [self._record_batched(call, result) for call, result in zip(calls, results)]
+                    self.log(f"⚠️  /batch returned an unexpected body, falling back to individual calls: {response.text}")
+                elif response.status_code == 404:
+                    self._batch_supported = False
+                else:
+                    self.log(f"⚠️  /batch returned {response.status_code}, falling back to individual calls: {response.text}")
+        
+        return self.run_parallel([
+            partial(
+                self.run_get,
+                call['name'],
+                call['endpoint'],
+                200,
+                role=call['role'],
+                description=call['description']
+            )
+            for call in calls
+        ])
+
+    def _record_batched(self, call, result):
+        """Count and log one call answered by /batch"""
+        self._prepare(call['name'], call['endpoint'], call['role'], call['description'])
+        if self._record_status(call['name'], result['status'], 200):
+            return True, result['body'] if result['body'] is not None else {}
+        
+        self.log(f"   Error ({call['name']}): {result['body']}")
+        return False, {}
+
+    def _get_cached(self, key, endpoint, role=None, name=None, description=""):
+        """Fetch a list endpoint once per run and reuse it from self.test_data"""
+        if key not in self.test_data:
+            success, data = self.run_get(
+                name or f"Get {key}",
+                endpoint,
+                200,
+                role=role,
+                description=description
+            )
+            if not success:
+                return None
+            self.test_data[key] = data
+        return self.test_data[key]
 
     def test_health_check(self):
         """Test basic health endpoint"""
         self.log("\n🏥 Testing Health Check...")
-        success, data = self.run_test(
+        success, data = self.run_get(
             "Health Check",
-            "GET",
             "/health",
             200,
             description="Basic connectivity test"
@@ -91,112 +264,114 @@ class B2BAPITester:
             {"email": "buyer@manufacturing.com", "password": "buyer123", "role": "buyer"}
         ]
         
-        all_passed = True
-        for user in test_users:
-            success, data = self.run_test(
+        # Logins are independent, so their bcrypt checks overlap on the server
+        calls = [
+            partial(
+                self.run_post,
                 f"Login {user['role']}",
-                "POST",
                 "/login",
                 200,
                 data={"email": user["email"], "password": user["password"]},
                 description=f"Login as {user['role']} user"
             )
-            
-            if success and 'access_token' in data:
-                self.tokens[user['role']] = data['access_token']
-                self.users[user['role']] = data['user']
-                self.log(f"   ✅ Token stored for {user['role']}")
-            else:
-                all_passed = False
-                self.log(f"   ❌ Failed to get token for {user['role']}")
+            for user in test_users
+        ]
         
         # Test invalid login
-        success, _ = self.run_test(
+        calls.append(partial(
+            self.run_post,
             "Invalid Login",
-            "POST",
             "/login",
             401,
             data={"email": "invalid@test.com", "password": "wrongpass"},
             description="Should fail with invalid credentials"
-        )
+        ))
         
-        return all_passed and success
+        results = self.run_parallel(calls)
+        invalid_rejected, _ = results.pop()
+        
+        all_passed = True
+        for user, (success, data) in zip(test_users, results):
+            if success and 'access_token' in data:
+                self.tokens[user['role']] = data['access_token']
+                self.role_headers[user['role']] = {'Authorization': f"Bearer {data['access_token']}"}
+                self.users[user['role']] = data['user']
+                self.log(f"   ✅ Token stored for {user['role']}")
+            else:
+                all_passed = False
+                self.log(f"   ❌ Failed to get token for {user['role']}")
+        
+        return all_passed and invalid_rejected
 
     def test_user_info(self):
         """Test getting current user info"""
         self.log("\n👤 Testing User Info...")
         
-        all_passed = True
-        for role in ['admin', 'supplier', 'buyer']:
-            if role in self.tokens:
-                success, data = self.run_test(
-                    f"Get {role} info",
-                    "GET",
-                    "/me",
-                    200,
-                    token=self.tokens[role],
-                    description=f"Get current user info for {role}"
-                )
-                all_passed = all_passed and success
+        roles = [role for role in ['admin', 'supplier', 'buyer'] if role in self.tokens]
+        results = self.run_parallel([
+            partial(
+                self.run_get,
+                f"Get {role} info",
+                "/me",
+                200,
+                role=role,
+                description=f"Get current user info for {role}"
+            )
+            for role in roles
+        ])
         
-        return all_passed
+        return all(success for success, _ in results)
 
     def test_categories(self):
         """Test category endpoints"""
         self.log("\n📂 Testing Categories...")
         
         # Get categories (public endpoint)
-        success, data = self.run_test(
-            "Get Categories",
-            "GET",
-            "/categories",
-            200,
+        categories = self._get_cached(
+            'categories',
+            '/categories',
+            name="Get Categories",
             description="Fetch all product categories"
         )
         
-        if success and data:
-            self.test_data['categories'] = data
-            self.log(f"   Found {len(data)} categories")
+        if categories:
+            self.log(f"   Found {len(categories)} categories")
         
-        return success
+        return categories is not None
 
     def test_products(self):
         """Test product endpoints"""
         self.log("\n📦 Testing Products...")
         
         # Get all products
-        success, data = self.run_test(
-            "Get All Products",
-            "GET",
-            "/products",
-            200,
+        products = self._get_cached(
+            'products',
+            '/products',
+            name="Get All Products",
             description="Fetch all products"
         )
+        success = products is not None
         
-        if success and data:
-            self.test_data['products'] = data
-            self.log(f"   Found {len(data)} products")
+        if products:
+            self.log(f"   Found {len(products)} products")
             
             # Test getting specific product
-            if data:
-                product_id = data[0]['id']
-                success2, _ = self.run_test(
-                    "Get Specific Product",
-                    "GET",
-                    f"/products/{product_id}",
-                    200,
-                    description="Fetch specific product by ID"
-                )
-                success = success and success2
+            product_id = products[0]['id']
+            success2, _ = self.run_get(
+                "Get Specific Product",
+                f"/products/{product_id}",
+                200,
+                description="Fetch specific product by ID"
+            )
+            success = success and success2
         
         # Test supplier's products (requires supplier token)
         if 'supplier' in self.tokens:
-            success3, supplier_products = self.run_test(
+            success3, supplier_products = self.run_get(
                 "Get Supplier Products",
-                "GET",
                 "/my-products",
                 200,
-                token=self.tokens['supplier'],
+                role='supplier',
                 description="Get products owned by supplier"
             )
             success = success and success3
@@ -212,8 +387,9 @@ class B2BAPITester:
         all_passed = True
         
         # Test creating RFQ as buyer
-        if 'buyer' in self.tokens and self.test_data.get('products'):
-            product_id = self.test_data['products'][0]['id']
+        products = self._get_cached('products', '/products')
+        if 'buyer' in self.tokens and products:
+            product_id = products[0]['id']
             rfq_data = {
                 "product_id": product_id,
                 "quantity": 50,
@@ -221,13 +397,12 @@ class B2BAPITester:
                 "expires_in_days": 7
             }
             
-            success, rfq_response = self.run_test(
+            success, rfq_response = self.run_post(
                 "Create RFQ (Buyer)",
-                "POST",
                 "/rfqs",
                 200,
                 data=rfq_data,
-                token=self.tokens['buyer'],
+                role='buyer',
                 description="Buyer creates new RFQ"
             )
             
@@ -238,21 +413,22 @@ class B2BAPITester:
             all_passed = all_passed and success
         
         # Test getting RFQs for different roles
-        for role in ['buyer', 'supplier', 'admin']:
-            if role in self.tokens:
-                success, rfqs = self.run_test(
-                    f"Get RFQs ({role})",
-                    "GET",
-                    "/rfqs",
-                    200,
-                    token=self.tokens[role],
-                    description=f"Get RFQs visible to {role}"
-                )
-                
-                if success:
-                    self.log(f"   {role} can see {len(rfqs)} RFQs")
-                
-                all_passed = all_passed and success
+        roles = [role for role in ['buyer', 'supplier', 'admin'] if role in self.tokens]
+        results = self.run_batch([
+            {
+                "name": f"Get RFQs ({role})",
+                "endpoint": "/rfqs",
+                "role": role,
+                "description": f"Get RFQs visible to {role}"
+            }
+            for role in roles
+        ])
+        
+        for role, (success, rfqs) in zip(roles, results):
+            if success:
+                self.log(f"   {role} can see {len(rfqs)} RFQs")
+            
+            all_passed = all_passed and success
         
         return all_passed
 
@@ -272,13 +448,12 @@ class B2BAPITester:
                 "message": "Competitive pricing with fast delivery"
             }
             
-            success, quote_response = self.run_test(
+            success, quote_response = self.run_post(
                 "Submit Quote (Supplier)",
-                "POST",
                 "/quotes",
                 200,
                 data=quote_data,
-                token=self.tokens['supplier'],
+                role='supplier',
                 description="Supplier submits quote for RFQ"
             )
             
@@ -289,12 +464,11 @@ class B2BAPITester:
             all_passed = all_passed and success
             
             # Test getting quotes for the RFQ
-            success2, quotes = self.run_test(
+            success2, quotes = self.run_get(
                 "Get Quotes for RFQ",
-                "GET",
                 f"/quotes/{rfq_id}",
                 200,
-                token=self.tokens['buyer'],
+                role='buyer',
                 description="Buyer views quotes for their RFQ"
             )
             
@@ -319,13 +493,12 @@ class B2BAPITester:
                 "shipping_address": "123 Test Street, Test City, TC 12345"
             }
             
-            success, order_response = self.run_test(
+            success, order_response = self.run_post(
                 "Create Order (Buyer)",
-                "POST",
                 "/orders",
                 200,
                 data=order_data,
-                token=self.tokens['buyer'],
+                role='buyer',
                 description="Buyer creates order from quote"
             )
             
@@ -336,21 +509,22 @@ class B2BAPITester:
             all_passed = all_passed and success
         
         # Test getting orders for different roles
-        for role in ['buyer', 'supplier', 'admin']:
-            if role in self.tokens:
-                success, orders = self.run_test(
-                    f"Get Orders ({role})",
-                    "GET",
-                    "/orders",
-                    200,
-                    token=self.tokens[role],
-                    description=f"Get orders visible to {role}"
-                )
-                
-                if success:
-                    self.log(f"   {role} can see {len(orders)} orders")
-                
-                all_passed = all_passed and success
+        roles = [role for role in ['buyer', 'supplier', 'admin'] if role in self.tokens]
+        results = self.run_batch([
+            {
+                "name": f"Get Orders ({role})",
+                "endpoint": "/orders",
+                "role": role,
+                "description": f"Get orders visible to {role}"
+            }
+            for role in roles
+        ])
+        
+        for role, (success, orders) in zip(roles, results):
+            if success:
+                self.log(f"   {role} can see {len(orders)} orders")
+            
+            all_passed = all_passed and success
         
         return all_passed
 
@@ -360,21 +534,22 @@ class B2BAPITester:
         
         all_passed = True
         
-        for role in ['admin', 'supplier', 'buyer']:
-            if role in self.tokens:
-                success, stats = self.run_test(
-                    f"Dashboard Stats ({role})",
-                    "GET",
-                    "/dashboard/stats",
-                    200,
-                    token=self.tokens[role],
-                    description=f"Get dashboard statistics for {role}"
-                )
-                
-                if success:
-                    self.log(f"   {role} stats: {stats}")
-                
-                all_passed = all_passed and success
+        roles = [role for role in ['admin', 'supplier', 'buyer'] if role in self.tokens]
+        results = self.run_batch([
+            {
+                "name": f"Dashboard Stats ({role})",
+                "endpoint": "/dashboard/stats",
+                "role": role,
+                "description": f"Get dashboard statistics for {role}"
+            }
+            for role in roles
+        ])
+        
+        for role, (success, stats) in zip(roles, results):
+            if success:
+                self.log(f"   {role} stats: {stats}")
+            
+            all_passed = all_passed and success
         
         return all_passed
 
@@ -382,11 +557,12 @@ class B2BAPITester:
         """Test role-based access control"""
         self.log("\n🔒 Testing Role-Based Access Control...")
         
-        all_passed = True
+        calls = []
         
         # Test buyer trying to create product (should fail)
-        if 'buyer' in self.tokens and self.test_data.get('categories'):
-            category_id = self.test_data['categories'][0]['id']
+        categories = self._get_cached('categories', '/categories')
+        if 'buyer' in self.tokens and categories:
+            category_id = categories[0]['id']
             product_data = {
                 "name": "Unauthorized Product",
                 "description": "This should fail",
@@ -395,72 +571,92 @@ class B2BAPITester:
                 "stock_quantity": 10
             }
             
-            success, _ = self.run_test(
+            calls.append(partial(
+                self.run_post,
                 "Buyer Create Product (Should Fail)",
-                "POST",
                 "/products",
                 403,  # Forbidden
                 data=product_data,
-                token=self.tokens['buyer'],
+                role='buyer',
                 description="Buyer should not be able to create products"
-            )
-            all_passed = all_passed and success
+            ))
         
         # Test supplier trying to create RFQ (should fail)
-        if 'supplier' in self.tokens and self.test_data.get('products'):
-            product_id = self.test_data['products'][0]['id']
+        products = self._get_cached('products', '/products')
+        if 'supplier' in self.tokens and products:
+            product_id = products[0]['id']
             rfq_data = {
                 "product_id": product_id,
                 "quantity": 10,
                 "message": "This should fail"
             }
             
-            success, _ = self.run_test(
+            calls.append(partial(
+                self.run_post,
                 "Supplier Create RFQ (Should Fail)",
-                "POST",
                 "/rfqs",
                 403,  # Forbidden
                 data=rfq_data,
-                token=self.tokens['supplier'],
+                role='supplier',
                 description="Supplier should not be able to create RFQs"
-            )
-            all_passed = all_passed and success
+            ))
         
-        return all_passed
+        return all(success for success, _ in self.run_parallel(calls))
+
+    def _run_suite(self, suite_name, test_func):
+        """Run one test suite and log its outcome"""
+        try:
+            result = bool(test_func())
+        except Exception as e:
+            self.log(f"💥 {suite_name} - EXCEPTION: {str(e)}")
+            return False
+        
+        if result:
+            self.log(f"✅ {suite_name} - ALL PASSED")
+        else:
+            self.log(f"❌ {suite_name} - SOME FAILED")
+        return result
 
     def run_all_tests(self):
         """Run all backend API tests"""
         self.log("🚀 Starting B2B E-commerce Backend API Tests")
         self.log(f"   Base URL: {self.base_url}")
         self.log(f"   API URL: {self.api_url}")
+        self.flush_log()
         
         test_results = []
         
-        # Run all test suites
-        test_suites = [
-            ("Health Check", self.test_health_check),
-            ("Authentication", self.test_authentication),
-            ("User Info", self.test_user_info),
-            ("Categories", self.test_categories),
-            ("Products", self.test_products),
-            ("RFQs", self.test_rfqs),
-            ("Quotes", self.test_quotes),
-            ("Orders", self.test_orders),
-            ("Dashboard Stats", self.test_dashboard_stats),
-            ("Role-Based Access", self.test_role_based_access)
+        # Run all test suites; suites within a stage are independent and run
+        # concurrently, while later stages build on data from earlier ones
+        test_stages = [
+            [("Health Check", self.test_health_check),
+             ("Authentication", self.test_authentication)],
+            [("User Info", self.test_user_info),
+             ("Categories", self.test_categories),
+             ("Products", self.test_products)],
+            [("RFQs", self.test_rfqs),
+             ("Role-Based Access", self.test_role_based_access)],
+            [("Quotes", self.test_quotes)],
+            [("Orders", self.test_orders)],
+            [("Dashboard Stats", self.test_dashboard_stats)]
         ]
         
-        for suite_name, test_func in test_suites:
-            try:
-                result = test_func()
-                test_results.append((suite_name, result))
-                if result:
-                    self.log(f"✅ {suite_name} - ALL PASSED")
+        suite_passed = {}
+        for stage in test_stages:
+            futures = {}
+            for suite_name, test_func in stage:
+                failed_deps = [dep for dep in self.SUITE_DEPENDENCIES.get(suite_name, []) if not suite_passed.get(dep)]
+                if failed_deps:
+                    self.log(f"⏭️  {suite_name} - SKIPPED (prerequisites failed: {', '.join(failed_deps)})")
+                    futures[suite_name] = None
                 else:
-                    self.log(f"❌ {suite_name} - SOME FAILED")
-            except Exception as e:
-                self.log(f"💥 {suite_name} - EXCEPTION: {str(e)}")
-                test_results.append((suite_name, False))
+                    futures[suite_name] = self.suite_executor.submit(self._run_suite, suite_name, test_func)
+            
+            for suite_name, future in futures.items():
+                result = future.result() if future else None
+                test_results.append((suite_name, result))
+                suite_passed[suite_name] = bool(result)
+            self.flush_log()
         
         # Print final results
         self.log("\n" + "="*60)
@@ -471,7 +667,10 @@ class B2BAPITester:
         total_suites = len(test_results)
         
         for suite_name, result in test_results:
-            status = "✅ PASS" if result else "❌ FAIL"
+            if result is None:
+                status = "⏭️  SKIP"
+            else:
+                status = "✅ PASS" if result else "❌ FAIL"
             self.log(f"   {status} - {suite_name}")
         
         self.log(f"\n📈 SUMMARY:")
@@ -481,15 +680,21 @@ class B2BAPITester:
         
         if passed_suites == total_suites and self.tests_passed == self.tests_run:
             self.log("\n🎉 ALL TESTS PASSED! Backend API is working correctly.")
-            return 0
+            exit_code = 0
         else:
             self.log(f"\n⚠️  Some tests failed. Please check the issues above.")
-            return 1
+            exit_code = 1
+        
+        self.flush_log()
+        return exit_code
 
 def main():
     """Main test execution"""
     tester = B2BAPITester()
-    return tester.run_all_tests()
+    try:
+        return tester.run_all_tests()
+    finally:
+        tester.close()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file